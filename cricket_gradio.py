@@ -1,53 +1,303 @@
 import os
+import re
+import json
+import math
+import time
 import asyncio
-import threading
+import anyio
+from pathlib import Path
 import gradio as gr
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+from mcp.types import Tool
 from langgraph.prebuilt import create_react_agent
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+from langchain_core.messages import RemoveMessage
 from dotenv import load_dotenv
 load_dotenv()
 
+# Use uvloop for the event loop when available (not supported on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Set your Gemini API key
 google_api_key = os.getenv("GOOGLE_API_KEY")
 
-class AgentManager:
+# MCP client, session and tool list are shared across agents so warm starts skip the
+# stdio spawn + ListTools round-trip
+_CLIENT_CACHE = {}
+_TOOLS_CACHE = {"tools": None}
+# One session (and server process) serves every tool call for the app's lifetime; a
+# background task owns it so it is entered and exited in the same task
+_SESSION = {"session": None, "stop": None, "task": None, "loop": None}
+_tools_lock = asyncio.Lock()
+_session_lock = asyncio.Lock()
+# Raised by a session whose server process has gone away
+_SESSION_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError)
+
+CRICKET_SERVER = {
+    "command": "python",
+    "args": ["cricket_server.py"],
+    "transport": "stdio",
+}
+
+# Tool schemas are also saved to disk, keyed on the server source's mtime, so a
+# restarted (or reloaded) app builds its tools without starting the server; it is
+# only spawned once a question needs a tool, or to list tools after the source changes
+SERVER_SCRIPT = Path(__file__).with_name("cricket_server.py")
+TOOL_SCHEMA_CACHE = Path(__file__).with_name(".tools_cache.json")
+
+
+def load_tool_schemas(mtime):
+    """Return the saved MCP tool schemas if they were listed from this version of the server."""
+    try:
+        data = json.loads(TOOL_SCHEMA_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("mtime") != mtime:
+        return None
+    return [Tool.model_validate(tool) for tool in data.get("tools", [])]
+
+
+def save_tool_schemas(schemas, mtime):
+    try:
+        TOOL_SCHEMA_CACHE.write_text(
+            json.dumps({
+                "mtime": mtime,
+                "tools": [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in schemas],
+            }),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        print(f"Could not save tool schema cache: {e}")
+
+
+async def _hold_session(client, ready):
+    """Open the cricket MCP session, hand it over through ``ready`` and keep it open until stopped."""
+    stop = asyncio.Event()
+    try:
+        async with client.session("cricket") as session:
+            ready.set_result((session, stop))
+            await stop.wait()
+    except Exception as e:
+        if ready.done():
+            raise
+        ready.set_exception(e)
+
+
+async def get_cricket_session(client):
+    """Return the shared cricket MCP session, (re)opening it if it isn't running."""
+    async with _session_lock:
+        task = _SESSION["task"]
+        if task is None or task.done():
+            loop = asyncio.get_running_loop()
+            ready = loop.create_future()
+            task = loop.create_task(_hold_session(client, ready))
+            session, stop = await ready
+            _SESSION.update(session=session, stop=stop, task=task, loop=loop)
+        return _SESSION["session"]
+
+
+async def _reset_session(session):
+    """Close ``session`` if it is still the shared one, so the next call starts a new server."""
+    async with _session_lock:
+        if _SESSION["session"] is session:
+            await _stop_session()
+
+
+class SharedSession:
+    """Stand-in ``ClientSession`` for the LangChain tools that forwards each call to the
+    current shared session, so the tools outlive any one server process."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def call_tool(self, *args, **kwargs):
+        session = await get_cricket_session(self.client)
+        try:
+            return await session.call_tool(*args, **kwargs)
+        except _SESSION_ERRORS:
+            # The server process died; start a fresh one and try once more
+            await _reset_session(session)
+            session = await get_cricket_session(self.client)
+            return await session.call_tool(*args, **kwargs)
+
+
+async def _stop_session():
+    task = _SESSION["task"]
+    if task is None:
+        return
+    _SESSION["stop"].set()
+    try:
+        await task
+    except Exception as e:
+        print(f"Error closing cricket MCP session: {e}")
+    _SESSION.update(session=None, stop=None, task=None)
+
+
+def close_cricket_session(timeout=5):
+    """Close the shared MCP session and its server process from outside the event loop."""
+    loop = _SESSION["loop"]
+    if _SESSION["task"] is None or loop is None or not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_stop_session(), loop).result(timeout)
+    except Exception as e:
+        print(f"Error closing cricket MCP session: {e}")
+
+
+async def get_cricket_tools():
+    """Return the cricket MCP client and tools, building the tools on first use.
+
+    The tools look the shared session up on every call, so they stay valid if the server
+    is restarted and are built once per app; the running server only picks up changes to
+    ``cricket_server.py`` when the app restarts, so there is nothing to refresh before then.
     """
-    Manages the asyncio event loop and the CricketAgent instance in a separate thread.
+    async with _tools_lock:
+        client = _CLIENT_CACHE.get("cricket")
+        if client is None:
+            client = MultiServerMCPClient({"cricket": CRICKET_SERVER})
+            _CLIENT_CACHE["cricket"] = client
+
+        if _TOOLS_CACHE["tools"] is None:
+            mtime = SERVER_SCRIPT.stat().st_mtime
+            schemas = load_tool_schemas(mtime)
+            if schemas is None:
+                session = await get_cricket_session(client)
+                schemas = (await session.list_tools()).tools
+                save_tool_schemas(schemas, mtime)
+            # Every tool call goes through the shared session instead of spawning a server;
+            # with cached schemas the session (and server) only starts on the first call
+            shared = SharedSession(client)
+            _TOOLS_CACHE["tools"] = [
+                convert_mcp_tool_to_langchain_tool(shared, schema, server_name="cricket")
+                for schema in schemas
+            ]
+
+        return client, _TOOLS_CACHE["tools"]
+
+
+# Number of previous exchanges kept per session; older turns are dropped from memory
+MAX_HISTORY_EXCHANGES = 5
+
+
+def trim_history(state):
+    """Pre-model hook that keeps only the last few exchanges (plus the new question).
+
+    Older turns are removed from the thread's state rather than just hidden from the
+    LLM, so the checkpointer stores a bounded history instead of every message ever sent.
+    """
+    messages = state["messages"]
+    human_turns = [i for i, message in enumerate(messages) if message.type == "human"]
+    if len(human_turns) <= MAX_HISTORY_EXCHANGES:
+        return {"llm_input_messages": messages}
+    # Cut at a user message so tool calls and their results stay paired
+    kept = messages[human_turns[-(MAX_HISTORY_EXCHANGES + 1)]:]
+    return {"messages": [RemoveMessage(id=REMOVE_ALL_MESSAGES), *kept]}
+
+def message_text(content):
+    """Extract plain text from message content, which may be a string or a list of content parts."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else part.get("text", "")
+        for part in content
+        if isinstance(part, (str, dict))
+    )
+
+# Number of data tools bound to the model per turn; the full list still backs the tool node
+TOOLS_PER_TURN = 4
+# A question must match at least one fairly distinctive tool word (idf ~2 or more) before
+# the selector trusts its ranking; weaker matches bind every tool
+MIN_TOOL_SCORE = 2.0
+# Generic helpers whose descriptions say nothing about the question; always bound, never ranked
+HELPER_TOOLS = frozenset({"batch_execute", "get_cache_stats", "get_result_detail"})
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from get give how i in is it me of on or show "
+    "tell the this to what when where which who with".split()
+)
+
+
+def _keywords(text):
+    # Single characters (the "s" of a possessive, stray initials) carry no meaning
+    return {
+        word for word in _WORD_RE.findall(text.lower())
+        if len(word) > 1 and word not in _STOPWORDS
+    }
+
+
+class ToolSelector:
+    """Bind only the data tools whose name and description best match the recent questions.
+
+    Words are weighted by inverse document frequency across the tool descriptions, so
+    terms every tool mentions (like "cricket") don't sway the ranking. Helper tools are
+    always bound, tools already called since the last question stay bound so multi-step
+    answers keep working, and every tool is bound when nothing matches well.
     """
-    def __init__(self):
-        self.loop = asyncio.new_event_loop()
-        self.thread = threading.Thread(target=self._start_loop, daemon=True)
-        self.agent = CricketAgent()
-        self._agent_initialized = threading.Event()
-        self.thread.start()
-
-    def _start_loop(self):
-        """Starts the asyncio event loop."""
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
-
-    def _run_coro_sync(self, coro):
-        """Runs a coroutine in the event loop and waits for the result."""
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-        return future.result()
-
-    def initialize_agent(self):
-        """Initializes the agent if not already done."""
-        if not self._agent_initialized.is_set():
-            self._run_coro_sync(self.agent.initialize())
-            self._agent_initialized.set()
-
-    def ask_question(self, question, chat_history):
-        """Asks a question to the agent."""
-        self.initialize_agent() # Ensure agent is initialized
-        return self._run_coro_sync(self.agent.ask_question(question, chat_history))
-
-    def clear_memory(self):
-        """Clears the agent's memory."""
-        if self._agent_initialized.is_set():
-            self.agent.clear_memory()
+
+    def __init__(self, model, tools, k=TOOLS_PER_TURN):
+        self.model = model
+        self.tools = tools
+        self.k = k
+        self.helpers = [tool for tool in tools if tool.name in HELPER_TOOLS]
+        self.ranked_tools = [tool for tool in tools if tool.name not in HELPER_TOOLS]
+        self.name_words = {
+            tool.name: _keywords(tool.name.replace("_", " ")) for tool in self.ranked_tools
+        }
+        self.words = {
+            tool.name: self.name_words[tool.name] | _keywords(tool.description or "")
+            for tool in self.ranked_tools
+        }
+        document_frequency = {}
+        for words in self.words.values():
+            for word in words:
+                document_frequency[word] = document_frequency.get(word, 0) + 1
+        self.idf = {
+            word: math.log((len(self.ranked_tools) + 1) / df)
+            for word, df in document_frequency.items()
+        }
+        self._bound = {}
+
+    def select(self, messages):
+        human_turns = [i for i, message in enumerate(messages) if message.type == "human"]
+        if not human_turns:
+            return self.tools
+        query = _keywords(" ".join(message_text(messages[i].content) for i in human_turns[-2:]))
+
+        def score(tool):
+            # Name matches count double: the name is the most specific description
+            return sum(self.idf.get(word, 0) for word in query & self.words[tool.name]) + sum(
+                self.idf.get(word, 0) for word in query & self.name_words[tool.name]
+            )
+
+        scores = {tool.name: score(tool) for tool in self.ranked_tools}
+        ranked = sorted(self.ranked_tools, key=lambda tool: scores[tool.name], reverse=True)
+        if not ranked or scores[ranked[0].name] < MIN_TOOL_SCORE:
+            return self.tools
+        selected = [tool for tool in ranked[: self.k] if scores[tool.name] > 0]
+
+        called = {
+            call["name"]
+            for message in messages[human_turns[-1]:]
+            for call in getattr(message, "tool_calls", None) or []
+        }
+        selected += [tool for tool in self.ranked_tools if tool.name in called and tool not in selected]
+        return selected + self.helpers
+
+    def __call__(self, state, runtime):
+        """Dynamic model for ``create_react_agent``: the chat model bound to this turn's tools."""
+        tools = self.select(state["messages"])
+        key = tuple(tool.name for tool in tools)
+        if key not in self._bound:
+            self._bound[key] = self.model.bind_tools(tools)
+        return self._bound[key]
+
 
 class CricketAgent:
     def __init__(self):
@@ -59,96 +309,96 @@ class CricketAgent:
     
     async def initialize(self):
         """Initialize the MCP client and agent"""
-        if self.initialized:
-            return
-            
-        self.client = MultiServerMCPClient(
-            {
-                "cricket": {
-                    "command": "python",
-                    "args": ["cricket_server.py"],
-                    "transport": "stdio",
-                }
-            }
-        )
-        tools = await self.client.get_tools()
-        
-        # Create the Gemini model
-        model = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
-            google_api_key=google_api_key
-        )
-        
-        # Create agent with memory
-        self.agent = create_react_agent(
-            model, 
-            tools, 
-            checkpointer=self.memory
-        )
-        self.initialized = True
+        async with _init_lock:
+            if self.initialized:
+                return
+
+            self.client, tools = await get_cricket_tools()
+
+            # Create the Gemini model
+            model = ChatGoogleGenerativeAI(
+                model="gemini-2.5-flash",
+                google_api_key=google_api_key
+            )
+
+            # Create agent with memory; the model only sees the tools picked for each turn
+            self.agent = create_react_agent(
+                ToolSelector(model, tools),
+                tools,
+                checkpointer=self.memory,
+                pre_model_hook=trim_history
+            )
+            self.initialized = True
     
-    async def ask_question(self, question, chat_history):
-        """Ask a question to the cricket agent with chat history"""
+    async def ask_question(self, question, chat_history, thread_id=None):
+        """Ask a question to the cricket agent, yielding the answer text as it streams in.
+
+        Earlier turns are replayed by the checkpointer under ``thread_id`` (one per browser
+        session, defaulting to ``self.thread_id``), so only the new question is sent;
+        ``chat_history`` is the Gradio display list and is not re-sent.
+        """
         try:
             if not self.initialized:
                 await self.initialize()
             
-            # Build the conversation history
-            messages = []
-            
-            # Add chat history (keeping last 5 exchanges = 10 messages)
-            for human_msg, ai_msg in chat_history[-5:]:
-                if human_msg:
-                    messages.append({"role": "user", "content": human_msg})
-                if ai_msg:
-                    messages.append({"role": "assistant", "content": ai_msg})
-            
-            # Add the current question
-            messages.append({"role": "user", "content": question})
+            messages = [{"role": "user", "content": question}]
             
-            # Invoke the agent with memory
-            config = {"configurable": {"thread_id": self.thread_id}}
-            response = await self.agent.ainvoke(
+            # Stream the agent run with memory
+            config = {"configurable": {"thread_id": thread_id or self.thread_id}}
+            answer = ""
+            async for chunk, metadata in self.agent.astream(
                 {"messages": messages},
-                config=config
-            )
-            
-            # Extract the final answer
-            final_message = response["messages"][-1]
-            return final_message.content
+                config=config,
+                stream_mode="messages"
+            ):
+                if metadata.get("langgraph_node") == "tools":
+                    # A tool ran, so any text so far was interim; start the answer afresh
+                    answer = ""
+                    continue
+                text = message_text(chunk.content)
+                if text:
+                    answer += text
+                    yield answer
         except Exception as e:
-            return f"Error: {str(e)}"
+            yield f"Error: {str(e)}"
     
-    def clear_memory(self):
-        """Clear the conversation memory"""
+    def clear_memory(self, thread_id=None):
+        """Clear the conversation memory for one session, or all of it"""
+        if thread_id:
+            self.memory.delete_thread(thread_id)
+            return
         self.memory = InMemorySaver()
         if self.agent:
             self.agent.checkpointer = self.memory
 
-# Global agent manager
-agent_manager = AgentManager()
+# Global agent, driven directly by Gradio's event loop
+cricket_agent = CricketAgent()
+_init_lock = asyncio.Lock()
 
-def process_cricket_query(message, chat_history):
-    """Process cricket query and return response with chat history"""
+async def process_cricket_query(message, chat_history, request: gr.Request):
+    """Process cricket query, streaming the response into the chat history"""
     if not message.strip():
-        return "", chat_history
+        yield "", chat_history
+        return
+    
+    # Show the question straight away, then fill in the answer as it streams
+    chat_history.append((message, ""))
+    yield "", chat_history
     
     try:
-        # Use the agent manager to handle the async call
-        response = agent_manager.ask_question(message, chat_history)
-        
-        # Add the new exchange to chat history
-        chat_history.append((message, response))
-        
-        return "", chat_history
+        async for partial_response in cricket_agent.ask_question(
+            message, chat_history, thread_id=request.session_hash
+        ):
+            chat_history[-1] = (message, partial_response)
+            yield "", chat_history
     except Exception as e:
         error_response = f"An error occurred: {str(e)}"
-        chat_history.append((message, error_response))
-        return "", chat_history
+        chat_history[-1] = (message, error_response)
+        yield "", chat_history
 
-def clear_chat():
-    """Clear chat history and agent memory"""
-    agent_manager.clear_memory()
+def clear_chat(request: gr.Request):
+    """Clear chat history and this session's agent memory"""
+    cricket_agent.clear_memory(request.session_hash)
     return [], ""
 
 # Create the Gradio interface
@@ -241,12 +491,16 @@ def create_interface():
             process_cricket_query,
             [msg_input, chatbot],
             [msg_input, chatbot],
+            queue=True,
+            concurrency_id="cricket",
         )
         
         send_btn.click(
             process_cricket_query,
             [msg_input, chatbot],
             [msg_input, chatbot],
+            queue=True,
+            concurrency_id="cricket",
         )
         
         clear_btn.click(
@@ -264,6 +518,8 @@ if __name__ == "__main__":
     
     # Create and launch the interface
     demo = create_interface()
+    # Queries are I/O-bound (LLM + MCP), so let several sessions run at once
+    demo.queue(default_concurrency_limit=16, max_size=64)
     
     print("🚀 Launching chat interface with memory...")
     print("🌐 Open your browser to start chatting about cricket!")
@@ -274,5 +530,16 @@ if __name__ == "__main__":
         server_port=7860,
         show_api=False,
         share=False,
-        inbrowser=True
+        inbrowser=True,
+        prevent_thread_lock=True
     )
+    # Wait here rather than in launch() so the MCP session is closed while Gradio's
+    # event loop is still running
+    try:
+        while demo.is_running:
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        close_cricket_session()
+        demo.close()
@@ -1,26 +1,395 @@
+import asyncio
+import functools
+import sys
+import weakref
+from contextlib import asynccontextmanager
+from pathlib import Path
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
-import requests
-from bs4 import BeautifulSoup
+from mcp.types import CallToolResult, TextContent
+import httpx
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 import re
 import time
-import json
 from googlesearch import search
 
-mcp = FastMCP("Cricket API")
+# Prefer zstd, then brotli, but only advertise the ones httpx has a decoder for
+_encodings = []
+try:
+    import zstandard  # noqa: F401
+    _encodings.append("zstd")
+except ImportError:
+    pass
+try:
+    import brotli  # noqa: F401
+    _encodings.append("br")
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _encodings.append("br")
+    except ImportError:
+        pass
+_ACCEPT_ENCODING = ", ".join(_encodings + ["gzip", "deflate"])
 
 # Add headers to mimic a browser
+# (no "Connection" header: keep-alive is handled by the client and the header is illegal over HTTP/2)
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
-    'Accept-Encoding': 'gzip, deflate',
-    'Connection': 'keep-alive',
+    'Accept-Encoding': _ACCEPT_ENCODING,
     'Upgrade-Insecure-Requests': '1',
 }
 
+# Shared HTTP/2 client so every tool reuses the same connection pool; idle connections
+# are kept for a minute so back-to-back tool calls skip the TCP + TLS handshake.
+# Failed connects, 429s and 5xx responses are retried before a tool sees the error.
+_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60)
+
+# Responses seen per Content-Encoding, reported by get_cache_stats to confirm compression is honored
+_ENCODING_STATS: dict[str, int] = {}
+
+
+async def _count_encoding(response: httpx.Response):
+    encoding = response.headers.get("Content-Encoding", "identity")
+    _ENCODING_STATS[encoding] = _ENCODING_STATS.get(encoding, 0) + 1
+
+
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_MAX_DELAY = 10
+# Total time a request may spend on retries, counted from its first attempt
+_RETRY_BUDGET = 8
+
+
+class _RetryTransport(httpx.AsyncBaseTransport):
+    """Retry idempotent requests that come back rate-limited or with a 5xx, backing off exponentially.
+
+    A numeric Retry-After header from the server takes precedence over the backoff delay,
+    capped per wait at _RETRY_MAX_DELAY. No retry starts once its wait would take the
+    request past _RETRY_BUDGET seconds in total, and requests sent with
+    ``extensions={"retry": False}`` are never retried.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        deadline = time.monotonic() + _RETRY_BUDGET
+        for attempt in range(_RETRY_ATTEMPTS + 1):
+            response = await self._transport.handle_async_request(request)
+            if (
+                response.status_code not in _RETRY_STATUSES
+                or request.method not in ("GET", "HEAD")
+                or not request.extensions.get("retry", True)
+                or attempt == _RETRY_ATTEMPTS
+            ):
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else _RETRY_BACKOFF * 2 ** attempt
+            delay = min(delay, _RETRY_MAX_DELAY)
+            if time.monotonic() + delay > deadline:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+# HTTP/2 multiplexes many requests over one connection, so the pool limits don't cap how
+# hard a single host gets hit; this does
+_PER_HOST_CONCURRENCY = 8
+
+
+class _HostLimitTransport(httpx.AsyncBaseTransport):
+    """Allow at most _PER_HOST_CONCURRENCY requests in flight to any one host."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(_PER_HOST_CONCURRENCY)
+        async with semaphore:
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+_client = httpx.AsyncClient(
+    transport=_RetryTransport(
+        _HostLimitTransport(httpx.AsyncHTTPTransport(http2=True, limits=_LIMITS, retries=2))
+    ),
+    timeout=10,
+    headers=HEADERS,
+    follow_redirects=True,
+    event_hooks={"response": [_count_encoding]},
+)
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await _client.aclose()
+
+
+mcp = FastMCP("Cricket API", lifespan=_lifespan)
+
+
+def _json_result(result, meta: dict | None = None) -> CallToolResult:
+    """Serialize a tool result once, compactly, with orjson (FastMCP would pretty-print each list item)."""
+    return CallToolResult(
+        content=[TextContent(type="text", text=orjson.dumps(result).decode())],
+        structuredContent=result if isinstance(result, dict) else {"result": result},
+        _meta=meta,
+    )
+
+
+def _tool(cache_hint: str | None = None, ttl_seconds: int | None = None):
+    """Register an async function as an MCP tool whose result is serialized by _json_result.
+
+    cache_hint/ttl_seconds are attached to every result as `_meta`, telling clients whether the
+    result may be cached (e.g. "no-cache" for live data, "ephemeral" for slow-changing profiles).
+    The undecorated function is returned so tools can still call each other directly.
+    """
+    meta = None
+    if cache_hint:
+        meta = {"cache_hint": cache_hint}
+        if ttl_seconds is not None:
+            meta["ttl_seconds"] = ttl_seconds
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return _json_result(await fn(*args, **kwargs), meta)
+
+        mcp.tool()(wrapper)
+        return fn
+
+    return decorator
+
+# In-process TTL caches for scraped data
+_LIVE_CACHE = TTLCache(maxsize=64, ttl=60)         # parsed live scores, keyed by tool call
+_PAGE_CACHE = TTLCache(maxsize=256, ttl=300)       # parsed news and schedule, keyed by tool call
+_PLAYER_CACHE = TTLCache(maxsize=256, ttl=86400)   # parsed player profiles, keyed by player name
+_RANKINGS_CACHE = TTLCache(maxsize=8, ttl=3600)    # parsed ICC rankings, keyed by category
+_SEARCH_META_CACHE = TTLCache(maxsize=512, ttl=3600)  # web_search titles and snippets, keyed by URL
+# ETag/Last-Modified plus content of fetched pages, so repeat fetches can be conditional
+# GETs that the server answers with an empty 304 when nothing changed
+_VALIDATOR_CACHE = TTLCache(maxsize=64, ttl=86400)
+_CACHES = {
+    "live": _LIVE_CACHE,
+    "pages": _PAGE_CACHE,
+    "players": _PLAYER_CACHE,
+    "rankings": _RANKINGS_CACHE,
+    "search_meta": _SEARCH_META_CACHE,
+    "validators": _VALIDATOR_CACHE,
+}
+
+# Full payloads behind the compact handles returned by heavy tools, see get_result_detail
+_RESULT_STORE = TTLCache(maxsize=128, ttl=3600)
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+# One lock per cache key so concurrent callers share a single fetch
+_FETCH_LOCKS = weakref.WeakValueDictionary()
+
+
+def _is_error(value) -> bool:
+    """True for a tool's error result: an error dict, or a list led by one."""
+    if isinstance(value, list) and value:
+        value = value[0]
+    return isinstance(value, dict) and "error" in value
+
+
+async def _cached(cache: TTLCache, key, load):
+    """Return cache[key], calling the async `load` once on a miss. Error results are not cached."""
+    value = cache.get(key)
+    if value is not None:
+        _CACHE_STATS["hits"] += 1
+        return value
+
+    lock_key = (id(cache), key)
+    lock = _FETCH_LOCKS.get(lock_key)
+    if lock is None:
+        lock = _FETCH_LOCKS[lock_key] = asyncio.Lock()
+
+    async with lock:
+        value = cache.get(key)
+        if value is not None:
+            _CACHE_STATS["hits"] += 1
+            return value
+        _CACHE_STATS["misses"] += 1
+        value = await load()
+        if not _is_error(value):
+            cache[key] = value
+        return value
+
+
+def _ttl_cached(cache: TTLCache):
+    """Cache an async tool's final result in ``cache``, keyed on its arguments, so hits skip fetch and parse."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            return await _cached(cache, key, lambda: fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+# Persisted player name -> Cricbuzz profile URL index, so repeat lookups skip the search.
+# Each entry records when it was saved and is dropped after PLAYER_INDEX_MAX_AGE.
+PLAYER_INDEX_PATH = Path(__file__).with_name("player_index.json")
+PLAYER_INDEX_MAX_AGE = 30 * 86400
+
+
+def _player_key(player_name: str) -> str:
+    """Normalize a player name for cache and index lookups."""
+    return " ".join(player_name.lower().split())
+
+
+def _load_player_index() -> dict:
+    """Load the player index from disk, skipping entries older than PLAYER_INDEX_MAX_AGE."""
+    try:
+        data = orjson.loads(PLAYER_INDEX_PATH.read_bytes())
+        file_saved = PLAYER_INDEX_PATH.stat().st_mtime
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+    if not isinstance(data, dict):
+        # A hand-edited or foreign file; start over rather than fail every lookup
+        return {}
+
+    cutoff = time.time() - PLAYER_INDEX_MAX_AGE
+    index = {}
+    for key, entry in data.items():
+        if isinstance(entry, str):
+            # Older index files stored bare URLs; date them by the file itself
+            entry = {"url": entry, "saved": file_saved}
+        if not isinstance(entry, dict):
+            continue
+        url, saved = entry.get("url"), entry.get("saved")
+        if not isinstance(url, str) or not isinstance(saved, (int, float)) or isinstance(saved, bool):
+            continue
+        if saved > cutoff:
+            index[key] = {"url": url, "saved": saved}
+    return index
+
+
+def _save_player_index():
+    """Write the player index back to disk; failures only cost future lookups."""
+    try:
+        PLAYER_INDEX_PATH.write_bytes(
+            orjson.dumps(_PLAYER_INDEX, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+    except OSError as e:
+        print(f"Could not save player index: {e}", file=sys.stderr)
+
 
-@mcp.tool()
-def get_player_stats(player_name: str, match_format: str = None) -> dict:
+def _index_lookup(key: str) -> str | None:
+    """Return the indexed profile URL for a normalized player name, unless it has expired."""
+    entry = _PLAYER_INDEX.get(key)
+    if entry and time.time() - entry["saved"] < PLAYER_INDEX_MAX_AGE:
+        return entry["url"]
+    return None
+
+
+def _index_add(key: str, url: str):
+    """Record a player's profile URL, stamped with the current time."""
+    _PLAYER_INDEX[key] = {"url": url, "saved": time.time()}
+
+
+_PLAYER_INDEX: dict[str, dict] = _load_player_index()
+
+
+async def _google(query: str, num_results: int) -> list[str]:
+    """Run a blocking googlesearch query in a worker thread so other tool calls keep running."""
+    return await asyncio.to_thread(lambda: list(search(query, num_results=num_results, lang="en")))
+
+
+def _slice_html(html: bytes, marker: bytes) -> bytes:
+    """Drop everything before the tag containing ``marker`` so only the useful part gets parsed.
+
+    The parser closes the tags left open at the cut, and the full page is returned
+    unchanged if the marker is missing.
+    """
+    idx = html.find(marker)
+    if idx == -1:
+        return html
+    return html[html.rfind(b"<", 0, idx):]
+
+
+# Page downloads in progress, so concurrent requests for the same page share one fetch
+_INFLIGHT: dict[tuple, asyncio.Task] = {}
+
+
+async def _fetch_html(url: str, marker: bytes | None = None) -> tuple[bytes | None, dict | None]:
+    """Fetch a page's raw HTML bytes, optionally sliced at ``marker``, as ``(content, error)``.
+
+    Exactly one of the pair is None; the error is a dict ready for a tool to return. The
+    bytes go to the parser as-is, which skips decoding the whole page to a str first.
+    Callers asking for a page that is already being downloaded wait on that download.
+    """
+    key = (url, marker)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_download_html(url, marker))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # Shielded so one caller giving up doesn't cancel the download for the others
+    return await asyncio.shield(task)
+
+
+async def _download_html(url: str, marker: bytes | None) -> tuple[bytes | None, dict | None]:
+    key = (url, marker)
+    validated = _VALIDATOR_CACHE.get(key)
+    headers = {}
+    if validated:
+        etag, last_modified, _ = validated
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    try:
+        response = await _client.get(url, headers=headers)
+        if response.status_code == 304 and validated:
+            # Unchanged since the last fetch; reuse the stored copy
+            return validated[2], None
+        response.raise_for_status()
+    except httpx.ConnectError as e:
+        return None, {"error": f"Connection error: {str(e)}"}
+    except httpx.TimeoutException as e:
+        return None, {"error": f"Request timeout: {str(e)}"}
+    except httpx.HTTPStatusError as e:
+        return None, {"error": f"HTTP error: {str(e)}"}
+    except Exception as e:
+        return None, {"error": f"Request failed: {str(e)}"}
+    content = response.content
+    if marker:
+        content = _slice_html(content, marker)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _VALIDATOR_CACHE[key] = (etag, last_modified, content)
+    return content, None
+
+
+@_tool(cache_hint="ephemeral", ttl_seconds=86400)
+async def get_player_stats(player_name: str, match_format: str = None) -> dict:
     """
     Get comprehensive cricket player statistics including batting and bowling data from Cricbuzz.
     
@@ -37,97 +406,168 @@ def get_player_stats(player_name: str, match_format: str = None) -> dict:
               - Detailed bowling stats (balls, runs, wickets, best figures, economy, five-wicket hauls)
               If match_format is specified, returns stats for that format only.
     """
-    query = f"{player_name} cricbuzz"
-    profile_link = None
+    player_data = await _cached(
+        _PLAYER_CACHE, _player_key(player_name), lambda: _scrape_player_stats(player_name)
+    )
+    if "error" in player_data:
+        return player_data
+
+    if match_format:
+        match_format = match_format.lower()
+        if match_format in player_data["batting_stats"]:
+            return {
+                "name": player_data["name"],
+                "country": player_data["country"],
+                "role": player_data["role"],
+                "batting_stats": player_data["batting_stats"][match_format],
+                "bowling_stats": player_data["bowling_stats"].get(match_format, {})
+            }
+        else:
+            return {"error": f"No {match_format} stats found for {player_name}"}
+
+    return player_data
+
+
+# Selectors for the player profile page, built once instead of per call
+_SEL_PROFILE = "div#playerProfile"
+_SEL_PROFILE_CARD = 'div[class="cb-col cb-col-100 cb-bg-white"]'
+_SEL_NAME = "h1.cb-font-40"
+_SEL_COUNTRY = 'h3[class="cb-font-18 text-gray"]'
+_SEL_PERSONAL = 'div[class="cb-col cb-col-60 cb-lst-itm-sm"]'
+_SEL_RANK = 'div[class="cb-col cb-col-25 cb-plyr-rank text-right"]'
+_SEL_STATS_TABLE = "div.cb-plyr-tbl"
+_SEL_STATS_BODY = "tbody"
+
+
+def _table_rows(table):
+    """Yield each body row of a stats table as stripped cell texts, walking children directly."""
+    body = table.css_first(_SEL_STATS_BODY)
+    if body is None:
+        return
+    strip = str.strip
+    for row in body.iter():
+        if row.tag == "tr":
+            yield [strip(cell.text()) for cell in row.iter() if cell.tag == "td"]
+
+
+_PROFILE_HREF_RE = re.compile(rb'href="(/profiles/\d+/([^"#?/]+))"')
+_NAME_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _slug_matches(slug: str, player_name: str) -> bool:
+    """Whether a profile slug like ``virat-kohli`` contains every token of the player name."""
+    name_tokens = _NAME_TOKEN_RE.findall(_player_key(player_name))
+    return bool(name_tokens) and set(name_tokens) <= set(_NAME_TOKEN_RE.findall(slug.lower()))
+
+
+async def _resolve_player_profile(player_name: str) -> str | None:
+    """Find a player's Cricbuzz profile URL, trying Cricbuzz's own search before Google.
+
+    Cricbuzz search hits are only accepted when the URL slug matches the name, so an
+    unrelated first hit (a team-mate, a namesake's article) never gets saved to the
+    player index. Google handles full names, initials and misspellings the slug check
+    can't, so there a matching slug is preferred but the top profile hit is accepted.
+    """
     try:
-        results = search(query, num_results=5)
-        for link in results:
-            if "cricbuzz.com/profiles/" in link:
-                profile_link = link
-                print(f"Found profile: {profile_link}")
-                break
-                
+        response = await _client.get(
+            "https://www.cricbuzz.com/search",
+            params={"q": player_name},
+            timeout=5,
+            # Google is the fallback, so a struggling search page isn't worth waiting on
+            extensions={"retry": False},
+        )
+        response.raise_for_status()
+        for match in _PROFILE_HREF_RE.finditer(response.content):
+            if _slug_matches(match.group(2).decode(), player_name):
+                return "https://www.cricbuzz.com" + match.group(1).decode()
+    except httpx.HTTPError as e:
+        print(f"Cricbuzz search failed, falling back to Google: {e}", file=sys.stderr)
+
+    # The profile is almost always a top hit, so a short result list is enough
+    profiles = [
+        link for link in await _google(f"{player_name} cricbuzz profile", 3)
+        if "cricbuzz.com/profiles/" in link
+    ]
+    for link in profiles:
+        path = link.split("cricbuzz.com/profiles/", 1)[1].split("?")[0].split("#")[0]
+        if _slug_matches(path, player_name):
+            print(f"Found profile: {link}", file=sys.stderr)
+            return link
+    if profiles:
+        print(f"Found profile: {profiles[0]}", file=sys.stderr)
+        return profiles[0]
+    return None
+
+
+async def _scrape_player_stats(player_name: str) -> dict:
+    """Find a player's Cricbuzz profile and parse all of its stats."""
+    key = _player_key(player_name)
+    profile_link = _index_lookup(key)
+    if not profile_link:
+        try:
+            profile_link = await _resolve_player_profile(player_name)
+        except Exception as e:
+            return {"error": f"Search failed: {str(e)}"}
+
         if not profile_link:
             return {"error": "No player profile found"}
-    except Exception as e:
-        return {"error": f"Search failed: {str(e)}"}
+
+        _index_add(key, profile_link)
+        _save_player_index()
     
-    # Get player profile page
-    try:
-        response = requests.get(profile_link, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        c = response.text
-    except requests.exceptions.ConnectionError as e:
-        return {"error": f"Connection error: {str(e)}"}
-    except requests.exceptions.Timeout as e:
-        return {"error": f"Request timeout: {str(e)}"}
-    except requests.exceptions.HTTPError as e:
-        return {"error": f"HTTP error: {str(e)}"}
-    except Exception as e:
-        return {"error": f"Failed to fetch player profile: {str(e)}"}
+    # Get player profile page; everything we read sits inside #playerProfile, so skip
+    # the head and site chrome before it
+    c, error = await _fetch_html(profile_link, marker=b'id="playerProfile"')
+    if error:
+        return error
     
-    cric = BeautifulSoup(c, "lxml")
-    profile = cric.find("div", id="playerProfile")
-    pc = profile.find("div", class_="cb-col cb-col-100 cb-bg-white")
+    cric = LexborHTMLParser(c)
+    profile = cric.css_first(_SEL_PROFILE)
+    pc = profile.css_first(_SEL_PROFILE_CARD)
     
     # Name, country and image
-    name = pc.find("h1", class_="cb-font-40").text
-    country = pc.find("h3", class_="cb-font-18 text-gray").text
+    name = pc.css_first(_SEL_NAME).text()
+    country = pc.css_first(_SEL_COUNTRY).text()
     image_url = None
-    images = pc.findAll('img')
-    for image in images:
-        image_url = image['src']
-        break  # Just get the first image
+    image = pc.css_first("img")
+    if image:
+        image_url = image.attributes.get("src")  # Just get the first image
 
     # Personal information and rankings
-    personal = cric.find_all("div", class_="cb-col cb-col-60 cb-lst-itm-sm")
-    role = personal[2].text.strip()
-    
-    icc = cric.find_all("div", class_="cb-col cb-col-25 cb-plyr-rank text-right")
-    # Batting rankings
-    tb = icc[0].text.strip()   # Test batting
-    ob = icc[1].text.strip()   # ODI batting
-    twb = icc[2].text.strip()  # T20 batting
+    personal = profile.css(_SEL_PERSONAL)
+    role = personal[2].text().strip()
     
-    # Bowling rankings
-    tbw = icc[3].text.strip()  # Test bowling
-    obw = icc[4].text.strip()  # ODI bowling
-    twbw = icc[5].text.strip() # T20 bowling
+    # Batting (Test, ODI, T20) then bowling (Test, ODI, T20) rankings
+    tb, ob, twb, tbw, obw, twbw = [node.text().strip() for node in profile.css(_SEL_RANK)[:6]]
 
     # Summary of the stats
-    summary = cric.find_all("div", class_="cb-plyr-tbl")
+    summary = profile.css(_SEL_STATS_TABLE)
     batting = summary[0]
     bowling = summary[1]
 
     # Batting statistics
-    bat_rows = batting.find("tbody").find_all("tr")
     batting_stats = {}
-    for row in bat_rows:
-        cols = row.find_all("td")
-        format_name = cols[0].text.strip().lower()  # e.g., "Test", "ODI", "T20"
-        batting_stats[format_name] = {
-            "matches": cols[1].text.strip(),
-            "runs": cols[3].text.strip(),
-            "highest_score": cols[5].text.strip(),
-            "average": cols[6].text.strip(),
-            "strike_rate": cols[7].text.strip(),
-            "hundreds": cols[12].text.strip(),
-            "fifties": cols[11].text.strip(),
+    for cols in _table_rows(batting):
+        batting_stats[cols[0].lower()] = {  # e.g., "test", "odi", "t20"
+            "matches": cols[1],
+            "runs": cols[3],
+            "highest_score": cols[5],
+            "average": cols[6],
+            "strike_rate": cols[7],
+            "hundreds": cols[12],
+            "fifties": cols[11],
         }
 
     # Bowling statistics
-    bowl_rows = bowling.find("tbody").find_all("tr")
     bowling_stats = {}
-    for row in bowl_rows:
-        cols = row.find_all("td")
-        format_name = cols[0].text.strip().lower()  # e.g., "Test", "ODI", "T20"
-        bowling_stats[format_name] = {
-            "balls": cols[3].text.strip(),
-            "runs": cols[4].text.strip(),
-            "wickets": cols[5].text.strip(),
-            "best_bowling_innings": cols[9].text.strip(),
-            "economy": cols[7].text.strip(),
-            "five_wickets": cols[11].text.strip(),
+    for cols in _table_rows(bowling):
+        bowling_stats[cols[0].lower()] = {  # e.g., "test", "odi", "t20"
+            "balls": cols[3],
+            "runs": cols[4],
+            "wickets": cols[5],
+            "best_bowling_innings": cols[9],
+            "economy": cols[7],
+            "five_wickets": cols[11],
         }
 
     # Create player stats dictionary
@@ -152,23 +592,11 @@ def get_player_stats(player_name: str, match_format: str = None) -> dict:
         "bowling_stats": bowling_stats
     }
 
-    if match_format:
-        match_format = match_format.lower()
-        if match_format in batting_stats:
-            return {
-                "name": name,
-                "country": country,
-                "role": role,
-                "batting_stats": batting_stats[match_format],
-                "bowling_stats": bowling_stats.get(match_format, {})
-            }
-        else:
-            return {"error": f"No {match_format} stats found for {player_name}"}
-
     return player_data
 
-@mcp.tool()
-def get_cricket_schedule() -> list:
+@_tool()
+@_ttl_cached(_PAGE_CACHE)
+async def get_cricket_schedule() -> list:
     """
     Get upcoming cricket match schedule from Cricbuzz.
     
@@ -177,53 +605,62 @@ def get_cricket_schedule() -> list:
               match description, and a link to the match if available.
     """
     link = "https://www.cricbuzz.com/cricket-schedule/upcoming-series/international"
+    source, error = await _fetch_html(link, marker=b'id="international-list"')
+    if error:
+        return [error]
     try:
-        response = requests.get(link, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        source = response.text
-        page = BeautifulSoup(source, "lxml")
+        page = LexborHTMLParser(source)
         
         schedule = []
-        schedule_container = page.find("div", id="international-list")
+        schedule_container = page.css_first("div#international-list")
         if not schedule_container:
             return [{"error": "Could not find the schedule container"}]
 
-        days = schedule_container.find_all("div", class_="cb-col-100 cb-col")
+        days = schedule_container.css('div[class="cb-col-100 cb-col"]')
         for day in days:
-            date_tag = day.find("div", class_="cb-lv-grn-strip")
+            date_tag = day.css_first("div.cb-lv-grn-strip")
             if not date_tag:
                 continue
             
-            date = date_tag.text.strip()
-            matches = day.find_all("div", class_="cb-ovr-flo cb-col-50 cb-col cb-mtchs-dy-vnu cb-adjst-lst")
+            date = date_tag.text().strip()
+            matches = day.css('div[class="cb-ovr-flo cb-col-50 cb-col cb-mtchs-dy-vnu cb-adjst-lst"]')
             for match in matches:
                 match_details = {}
-                anchor = match.find("a")
+                anchor = match.css_first("a")
                 if anchor:
                     match_details["date"] = date
-                    match_details["description"] = anchor.text.strip()
-                    url_suffix = anchor.get("href")
+                    match_details["description"] = anchor.text().strip()
+                    url_suffix = anchor.attributes.get("href")
                     if url_suffix:
                         match_details["url"] = "https://www.cricbuzz.com" + url_suffix
                     
-                    venue_tag = match.find("div", class_="cb-font-12 text-gray cb-ovr-flo")
+                    venue_tag = match.css_first('div[class="cb-font-12 text-gray cb-ovr-flo"]')
                     if venue_tag:
-                        match_details["venue"] = venue_tag.text.strip()
+                        match_details["venue"] = venue_tag.text().strip()
                     
                     schedule.append(match_details)
 
         return schedule
-    except requests.exceptions.ConnectionError as e:
-        return [{"error": f"Connection error: {str(e)}"}]
-    except requests.exceptions.Timeout as e:
-        return [{"error": f"Request timeout: {str(e)}"}]
-    except requests.exceptions.HTTPError as e:
-        return [{"error": f"HTTP error: {str(e)}"}]
     except Exception as e:
         return [{"error": f"Failed to get cricket schedule: {str(e)}"}]
 
-@mcp.tool()
-def get_match_details(match_url: str) -> dict:
+# Scorecard cells are the divs whose class starts with this prefix
+_SCORE_CELL_PREFIX = "cb-col cb-col-w-"
+_SEL_SCORE_CELL = f'div[class^="{_SCORE_CELL_PREFIX}"]'
+_INNING_ID_RE = re.compile(r"^inning_\d+$")
+
+
+def _score_cells(row) -> list[str]:
+    """Return the stripped text of a scorecard row's cells, read from its direct children."""
+    return [
+        child.text().strip()
+        for child in row.iter()
+        if (child.attributes.get("class") or "").startswith(_SCORE_CELL_PREFIX)
+    ]
+
+
+@_tool(cache_hint="no-cache", ttl_seconds=10)
+async def get_match_details(match_url: str) -> dict:
     """
     Get detailed scorecard for a specific cricket match from a Cricbuzz URL.
     
@@ -238,86 +675,79 @@ def get_match_details(match_url: str) -> dict:
     if not match_url or "cricbuzz.com" not in match_url:
         return {"error": "A valid Cricbuzz match URL is required."}
         
+    # The title heading comes before the result line and every innings, so start there
+    source, error = await _fetch_html(match_url, marker=b'class="cb-nav-hdr')
+    if error:
+        return error
     try:
-        response = requests.get(match_url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        source = response.text
-        page = BeautifulSoup(source, "lxml")
-    except requests.exceptions.ConnectionError as e:
-        return {"error": f"Connection error: {str(e)}"}
-    except requests.exceptions.Timeout as e:
-        return {"error": f"Request timeout: {str(e)}"}
-    except requests.exceptions.HTTPError as e:
-        return {"error": f"HTTP error: {str(e)}"}
+        page = LexborHTMLParser(source)
     except Exception as e:
-        return {"error": f"Failed to fetch or parse match page: {str(e)}"}
+        return {"error": f"Failed to parse match page: {str(e)}"}
 
     match_data = {}
 
     # Extract title and result
-    title_tag = page.find("h1", class_="cb-nav-hdr")
+    title_tag = page.css_first("h1.cb-nav-hdr")
     if title_tag:
-        match_data["title"] = title_tag.text.strip()
+        match_data["title"] = title_tag.text().strip()
     
-    result_tag = page.find("div", class_="cb-nav-text")
+    result_tag = page.css_first("div.cb-nav-text")
     if result_tag:
-        match_data["result"] = result_tag.text.strip()
+        match_data["result"] = result_tag.text().strip()
 
     # Scorecard
     scorecard = {}
-    innings_divs = page.find_all("div", id=re.compile(r"^inning_\d+$"))
+    innings_divs = [div for div in page.css('div[id^="inning_"]') if _INNING_ID_RE.match(div.id)]
 
     for i, inning_div in enumerate(innings_divs):
         inning_key = f"inning_{i+1}"
         inning_data = {"batting": [], "bowling": []}
         
-        inning_title_tag = inning_div.find("div", class_="cb-scrd-hdr-rw")
+        inning_title_tag = inning_div.css_first("div.cb-scrd-hdr-rw")
         if inning_title_tag:
-             inning_data["title"] = inning_title_tag.text.strip()
+             inning_data["title"] = inning_title_tag.text().strip()
         
         # Batting stats
-        batsmen = inning_div.find_all("div", class_=lambda x: x and x.startswith('cb-col cb-col-w-'))
-        for batsman in batsmen:
-            cols = batsman.find_all("div", class_=lambda x: x and x.startswith('cb-col cb-col-w-'))
-            if len(cols) > 1 and "batsman" in cols[0].text.lower(): # Header row
+        for batsman in inning_div.css(_SEL_SCORE_CELL):
+            cols = _score_cells(batsman)
+            if len(cols) > 1 and "batsman" in cols[0].lower(): # Header row
                 continue
 
             if len(cols) >= 7:
-                player_name = cols[0].text.strip()
+                player_name = cols[0]
                 if "Extras" in player_name or not player_name:
                     continue
                 
                 inning_data["batting"].append({
                     "player": player_name,
-                    "dismissal": cols[1].text.strip(),
-                    "R": cols[2].text.strip(),
-                    "B": cols[3].text.strip(),
-                    "4s": cols[4].text.strip(),
-                    "6s": cols[5].text.strip(),
-                    "SR": cols[6].text.strip(),
+                    "dismissal": cols[1],
+                    "R": cols[2],
+                    "B": cols[3],
+                    "4s": cols[4],
+                    "6s": cols[5],
+                    "SR": cols[6],
                 })
 
         # Bowling stats
-        bowlers_section = inning_div.find("div", class_="cb-col-bowlers")
+        bowlers_section = inning_div.css_first("div.cb-col-bowlers")
         if bowlers_section:
-            bowlers = bowlers_section.find_all("div", class_="cb-scrd-itms")
-            for bowler in bowlers:
-                cols = bowler.find_all("div", class_=lambda x: x and x.startswith('cb-col cb-col-w-'))
-                if len(cols) > 1 and "bowler" in cols[0].text.lower(): # Header row
+            for bowler in bowlers_section.css("div.cb-scrd-itms"):
+                cols = _score_cells(bowler)
+                if len(cols) > 1 and "bowler" in cols[0].lower(): # Header row
                     continue
                 
                 if len(cols) >= 6:
-                    player_name = cols[0].text.strip()
+                    player_name = cols[0]
                     if not player_name:
                         continue
                     
                     inning_data["bowling"].append({
                         "player": player_name,
-                        "O": cols[1].text.strip(),
-                        "M": cols[2].text.strip(),
-                        "R": cols[3].text.strip(),
-                        "W": cols[4].text.strip(),
-                        "Econ": cols[5].text.strip(),
+                        "O": cols[1],
+                        "M": cols[2],
+                        "R": cols[3],
+                        "W": cols[4],
+                        "Econ": cols[5],
                     })
         
         scorecard[inning_key] = inning_data
@@ -325,8 +755,10 @@ def get_match_details(match_url: str) -> dict:
     match_data["scorecard"] = scorecard
     return match_data
 
-@mcp.tool()
-def get_live_matches() -> list:
+# The hint reports the cache's own TTL, since that is how stale a result can be
+@_tool(cache_hint="no-cache", ttl_seconds=_LIVE_CACHE.ttl)
+@_ttl_cached(_LIVE_CACHE)
+async def get_live_matches() -> list:
     """Get live cricket matches from Cricbuzz.
     
     Returns:
@@ -334,24 +766,24 @@ def get_live_matches() -> list:
               Example: [{"match": "IND vs AUS...", "url": "https://..."}]
     """
     link = "https://www.cricbuzz.com/cricket-match/live-scores"
+    source, error = await _fetch_html(link, marker=b'id="page-wrapper"')
+    if error:
+        return [error]
     try:
-        response = requests.get(link, headers=HEADERS, timeout=10)
-        response.raise_for_status()  # Raise an exception for bad status codes
-        source = response.text
-        page = BeautifulSoup(source, "lxml")
+        page = LexborHTMLParser(source)
 
-        container = page.find("div", id="page-wrapper")
+        container = page.css_first("div#page-wrapper")
         if not container:
             return [{"error": "Could not find the main page wrapper"}]
             
-        matches = container.find_all("div", class_="cb-mtch-lst")
+        matches = container.css("div.cb-mtch-lst")
         live_matches = []
 
         for match in matches:
-            description_tag = match.find("a", class_="text-hvr-underline")
+            description_tag = match.css_first("a.text-hvr-underline")
             if description_tag:
-                match_text = description_tag.text.strip()
-                url_suffix = description_tag.get("href")
+                match_text = description_tag.text().strip()
+                url_suffix = description_tag.attributes.get("href")
                 
                 if url_suffix:
                     url = "https://www.cricbuzz.com" + url_suffix
@@ -359,79 +791,118 @@ def get_live_matches() -> list:
         
         return live_matches
 
-    except requests.exceptions.ConnectionError as e:
-        return [{"error": f"Connection error: {str(e)}"}]
-    except requests.exceptions.Timeout as e:
-        return [{"error": f"Request timeout: {str(e)}"}]
-    except requests.exceptions.HTTPError as e:
-        return [{"error": f"HTTP error: {str(e)}"}]
     except Exception as e:
         return [{"error": f"Failed to get live matches: {str(e)}"}]
 
 
-@mcp.tool()
-def get_cricket_news() -> list:
+@_tool()
+@_ttl_cached(_PAGE_CACHE)
+async def get_cricket_news() -> dict:
     """
     Get the latest cricket news from Cricbuzz.
+
+    To keep responses small, each article is listed with just its headline, URL and timestamp,
+    together with an id. Pass that id to get_result_detail to also get descriptions and categories.
     
     Returns:
-        list: A list of dictionaries, each containing news details including headline,
-              description, timestamp, category, and a direct URL to the article.
+        dict: {"id": str, "total": int, "headlines": [{"headline": str, "url": str, "timestamp": str}]}
+              where the full result behind "id" is a list of dictionaries with headline, description,
+              timestamp, category, and article URL.
     """
     link = "https://www.cricbuzz.com/cricket-news"
+    source, error = await _fetch_html(link, marker=b'id="news-list"')
+    if error:
+        return error
     try:
-        response = requests.get(link, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        source = response.text
-        page = BeautifulSoup(source, "lxml")
+        page = LexborHTMLParser(source)
 
         news_list = []
-        news_container = page.find("div", id="news-list")
+        news_container = page.css_first("div#news-list")
         if not news_container:
-            return [{"error": "Could not find the news container"}]
+            return {"error": "Could not find the news container"}
 
-        stories = news_container.find_all("div", class_="cb-col cb-col-100 cb-lst-itm cb-pos-rel cb-lst-itm-lg")
+        stories = news_container.css('div[class="cb-col cb-col-100 cb-lst-itm cb-pos-rel cb-lst-itm-lg"]')
 
         for story in stories:
             news_item = {}
             
-            headline_tag = story.find("a", class_="cb-nws-hdln-ancr")
+            headline_tag = story.css_first("a.cb-nws-hdln-ancr")
             if headline_tag:
-                news_item["headline"] = headline_tag.get("title", "").strip()
-                news_item["url"] = "https://www.cricbuzz.com" + headline_tag.get("href", "")
+                news_item["headline"] = (headline_tag.attributes.get("title") or "").strip()
+                news_item["url"] = "https://www.cricbuzz.com" + (headline_tag.attributes.get("href") or "")
 
-            description_tag = story.find("div", class_="cb-nws-intr")
+            description_tag = story.css_first("div.cb-nws-intr")
             if description_tag:
-                news_item["description"] = description_tag.text.strip()
-
-            time_tag = story.find("span", class_="cb-nws-time")
-            if time_tag:
-                news_item["timestamp"] = time_tag.text.strip()
+                news_item["description"] = description_tag.text().strip()
 
-            category_tag = story.find("div", class_="cb-nws-time")
-            if category_tag:
-                category_text = category_tag.text.strip()
-                if "•" in category_text:
-                    parts = category_text.split("•")
-                    if len(parts) > 1:
-                        news_item["category"] = parts[1].strip()
+            # Timestamp (span) and category (div) share the cb-nws-time class; find both at once
+            for time_node in story.css(".cb-nws-time"):
+                if time_node.tag == "span" and "timestamp" not in news_item:
+                    news_item["timestamp"] = time_node.text().strip()
+                elif time_node.tag == "div" and "category" not in news_item:
+                    category_text = time_node.text().strip()
+                    if "•" in category_text:
+                        news_item["category"] = category_text.split("•")[1].strip()
 
             if news_item:
                 news_list.append(news_item)
 
-        return news_list
-    except requests.exceptions.ConnectionError as e:
-        return [{"error": f"Connection error: {str(e)}"}]
-    except requests.exceptions.Timeout as e:
-        return [{"error": f"Request timeout: {str(e)}"}]
-    except requests.exceptions.HTTPError as e:
-        return [{"error": f"HTTP error: {str(e)}"}]
+        result_id = f"news:{int(time.time())}"
+        _RESULT_STORE[result_id] = news_list
+        return {
+            "id": result_id,
+            "total": len(news_list),
+            "headlines": [
+                {key: item[key] for key in ("headline", "url", "timestamp") if key in item}
+                for item in news_list
+                if item.get("headline")
+            ],
+        }
     except Exception as e:
-        return [{"error": f"Failed to get cricket news: {str(e)}"}]
+        return {"error": f"Failed to get cricket news: {str(e)}"}
+
+
+# Ranking row cells, each fetched with a single selector list per row
+_TEAM_POSITION_CLASS = "cb-col cb-col-20 cb-lst-itm-sm"
+_TEAM_NAME_CLASS = "cb-col cb-col-50 cb-lst-itm-sm text-left"
+_TEAM_RATING_CLASS = "cb-col cb-col-14 cb-lst-itm-sm"  # rating, then points
+_SEL_TEAM_CELLS = ", ".join(
+    f'div[class="{cls}"]' for cls in (_TEAM_POSITION_CLASS, _TEAM_NAME_CLASS, _TEAM_RATING_CLASS)
+)
+_PLAYER_POSITION_CLASS = "cb-col cb-col-16 cb-rank-tbl cb-font-16"
+_PLAYER_RATING_CLASS = "cb-col cb-col-17 cb-rank-tbl pull-right"
+_PLAYER_INFO_CLASS = "cb-col cb-col-67 cb-rank-plyr"
+_PLAYER_COUNTRY_CLASS = "cb-font-12 text-gray"
+_SEL_PLAYER_CELLS = (
+    f'div[class="{_PLAYER_POSITION_CLASS}"], div[class="{_PLAYER_RATING_CLASS}"], '
+    f'div[class="{_PLAYER_INFO_CLASS}"] a, div[class="{_PLAYER_INFO_CLASS}"] div[class="{_PLAYER_COUNTRY_CLASS}"]'
+)
+
+
+# ng-show of a rankings format container, e.g. "'batsmen-tests' == act_rank_format"
+_RANK_FORMAT_RE = re.compile(r"'([^']+)' == act_rank_format")
 
 
-@mcp.tool()
-def get_icc_rankings(category: str) -> dict:
+def _cells_by_class(row, selector: str) -> dict:
+    """Match all of a ranking row's cells in one query and group their stripped text by class.
+
+    Links are grouped under "a" (with the first link's href under "href"), since their
+    class varies.
+    """
+    cells = {"href": None}
+    for node in row.css(selector):
+        if node.tag == "a":
+            key = "a"
+            if cells["href"] is None:
+                cells["href"] = node.attributes.get("href")
+        else:
+            key = node.attributes.get("class")
+        cells.setdefault(key, []).append(node.text().strip())
+    return cells
+
+
+@_tool(cache_hint="ephemeral", ttl_seconds=3600)
+async def get_icc_rankings(category: str) -> dict:
     """
     Fetches official ICC cricket rankings for various categories. Use this tool to answer questions about top players and teams in Test, ODI, and T20 formats.
 
@@ -451,15 +922,21 @@ def get_icc_rankings(category: str) -> dict:
     if category not in ["batting", "bowling", "all-rounder", "teams"]:
         return {"error": "Invalid category. Choose from 'batting', 'bowling', 'all-rounder', 'teams'."}
 
+    # Rankings only move after each match day, so the parsed tables are reused for an hour
+    return await _cached(_RANKINGS_CACHE, category, lambda: _scrape_icc_rankings(category))
+
+
+async def _scrape_icc_rankings(category: str) -> dict:
+    """Fetch and parse the Cricbuzz ICC rankings page for one category."""
     # The 'all-rounder' category is spelled as 'all-rounder' in the URL
     url_category = category if category != "all-rounder" else "all-rounder"
     link = f"https://www.cricbuzz.com/cricket-stats/icc-rankings/men/{url_category}"
 
+    source, error = await _fetch_html(link)
+    if error:
+        return error
     try:
-        response = requests.get(link, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        source = response.text
-        page = BeautifulSoup(source, "lxml")
+        page = LexborHTMLParser(source)
 
         rankings = {}
         
@@ -474,14 +951,21 @@ def get_icc_rankings(category: str) -> dict:
             "teams": "teams"
         }
         angular_category = category_map.get(category)
+        index_updated = False
+
+        # Collect every format's container in one pass, keyed by the format in its ng-show
+        containers = {}
+        for div in page.css("div[ng-show]"):
+            match = _RANK_FORMAT_RE.fullmatch(div.attributes.get("ng-show") or "")
+            if match:
+                containers.setdefault(match.group(1), div)
 
         for f in formats:
             format_key = f"{angular_category}-{f}s" # e.g., batsmen-tests
             if f == 't20':
                  format_key = f"{angular_category}-t20s"
 
-            # Find the container for the specific format
-            format_container = page.find("div", {"ng-show": f"'{format_key}' == act_rank_format"})
+            format_container = containers.get(format_key)
             
             if not format_container:
                 continue
@@ -490,50 +974,63 @@ def get_icc_rankings(category: str) -> dict:
             
             if category == "teams":
                 # Find all team rows
-                rows = format_container.find_all("div", class_="cb-col cb-col-100 cb-font-14 cb-brdr-thin-btm text-center")
+                rows = format_container.css('div[class="cb-col cb-col-100 cb-font-14 cb-brdr-thin-btm text-center"]')
                 for row in rows:
-                    position = row.find("div", class_="cb-col cb-col-20 cb-lst-itm-sm").text.strip()
-                    team_name = row.find("div", class_="cb-col cb-col-50 cb-lst-itm-sm text-left").text.strip()
-                    rating = row.find_all("div", class_="cb-col cb-col-14 cb-lst-itm-sm")[0].text.strip()
-                    points = row.find_all("div", class_="cb-col cb-col-14 cb-lst-itm-sm")[1].text.strip()
+                    cells = _cells_by_class(row, _SEL_TEAM_CELLS)
+                    rating, points = cells[_TEAM_RATING_CLASS][:2]
 
                     ranking_list.append({
-                        "position": position,
-                        "team": team_name,
+                        "position": cells[_TEAM_POSITION_CLASS][0],
+                        "team": cells[_TEAM_NAME_CLASS][0],
                         "rating": rating,
                         "points": points
                     })
             else:
                 # Find all player rows
-                rows = format_container.find_all("div", class_="cb-col cb-col-100 cb-font-14 cb-lst-itm text-center")
+                rows = format_container.css('div[class="cb-col cb-col-100 cb-font-14 cb-lst-itm text-center"]')
 
                 for row in rows:
-                    position = row.find("div", class_="cb-col cb-col-16 cb-rank-tbl cb-font-16").text.strip()
-                    rating = row.find("div", class_="cb-col cb-col-17 cb-rank-tbl pull-right").text.strip()
-                    
-                    player_info = row.find("div", class_="cb-col cb-col-67 cb-rank-plyr")
-                    player_name = player_info.find("a").text.strip()
-                    country = player_info.find("div", class_="cb-font-12 text-gray").text.strip()
+                    cells = _cells_by_class(row, _SEL_PLAYER_CELLS)
+                    player_name = cells["a"][0]
+                    profile_href = cells["href"]
+                    player_key = _player_key(player_name)
+                    if profile_href and "/profiles/" in profile_href and _index_lookup(player_key) is None:
+                        # Ranked players' profile URLs come for free; remember them for get_player_stats
+                        _index_add(player_key, "https://www.cricbuzz.com" + profile_href)
+                        index_updated = True
 
                     ranking_list.append({
-                        "position": position,
+                        "position": cells[_PLAYER_POSITION_CLASS][0],
                         "player": player_name,
-                        "country": country,
-                        "rating": rating
+                        "country": cells[_PLAYER_COUNTRY_CLASS][0],
+                        "rating": cells[_PLAYER_RATING_CLASS][0]
                     })
             
             rankings[f] = ranking_list
 
+        if index_updated:
+            _save_player_index()
+
         return rankings
 
-    except requests.exceptions.RequestException as e:
-        return {"error": f"Request failed: {str(e)}"}
     except Exception as e:
         return {"error": f"An error occurred: {str(e)}"}
 
 
-@mcp.tool()
-def get_live_commentary(match_url: str, limit: int = 20) -> dict:
+# Formatting markers like "B0$" or "I0$" in commentary text, and runs of whitespace
+_COMM_MARKER_RE = re.compile(r"[A-Z]\d\$")
+_WS_RE = re.compile(r"\s+")
+# Numeric match id in a Cricbuzz match URL
+_MATCH_ID_RE = re.compile(r"/(\d{5,7})/")
+
+
+def _clean_comm_text(text: str) -> str:
+    """Strip formatting markers from a commentary line and normalize its whitespace."""
+    return _WS_RE.sub(" ", _COMM_MARKER_RE.sub("", text)).strip()
+
+
+@_tool(cache_hint="no-cache", ttl_seconds=10)
+async def get_live_commentary(match_url: str, limit: int = 20) -> dict:
     """
     Get recent live commentary events for a Cricbuzz match.
 
@@ -548,26 +1045,19 @@ def get_live_commentary(match_url: str, limit: int = 20) -> dict:
         return {"error": "A valid Cricbuzz match URL is required."}
 
     # Try official JSON commentary API first (more reliable than HTML scraping)
-    match_id_match = re.search(r"/(\d{5,7})/", match_url)
+    match_id_match = _MATCH_ID_RE.search(match_url)
     if not match_id_match:
         return {"error": "Could not extract match id from URL."}
     match_id = match_id_match.group(1)
 
     api_url = f"https://www.cricbuzz.com/api/cricket-match/commentary/{match_id}"
     try:
-        resp = requests.get(api_url, headers=HEADERS, timeout=15)
+        resp = await _client.get(api_url, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
     except Exception as e:
         data = None
 
-    def _clean_comm_text(text: str) -> str:
-        # Remove formatting markers like "B0$", "I0$" etc.
-        t = re.sub(r"[A-Z]\d\$", "", text)
-        # Normalize whitespace
-        t = re.sub(r"\s+", " ", t).strip()
-        return t
-
     if isinstance(data, dict) and data.get("commentaryList"):
         header = data.get("matchHeader", {})
         miniscore = data.get("miniscore", {})
@@ -597,25 +1087,42 @@ def get_live_commentary(match_url: str, limit: int = 20) -> dict:
         }
 
     # If JSON API fails, fall back to HTML scraping heuristics
-    def _fetch(url: str) -> BeautifulSoup | None:
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=15)
-            resp.raise_for_status()
-            return BeautifulSoup(resp.text, "lxml")
-        except Exception:
-            return None
+    return await _scrape_commentary_page(match_url, limit)
+
+
+async def _fetch_page(url: str) -> LexborHTMLParser | None:
+    """Fetch and parse a page, returning None on any failure."""
+    try:
+        resp = await _client.get(url, timeout=15)
+        resp.raise_for_status()
+        return LexborHTMLParser(resp.content)
+    except Exception:
+        return None
 
-    page = _fetch(match_url)
+
+# Commentary line layouts Cricbuzz has used, most specific first
+_COMMENTARY_SELECTORS = (
+    "div.cb-col.cb-col-90.cb-com-ln",
+    'div[class*="cb-com-lst"] div.cb-col.cb-col-90',
+    'p[class*="cb-com-ln"]',
+    'div[class*="cb-com-ln"]',
+)
+
+
+async def _scrape_commentary_page(match_url: str, limit: int) -> dict:
+    """Scrape commentary from the match's HTML commentary tab when the JSON API has none."""
+    page = await _fetch_page(match_url)
     if not page:
         return {"error": "Failed to load match page. The match might not be live or the URL may be incorrect."}
 
     commentary_url = None
     try:
-        nav = page.find("div", class_=re.compile("cb-nav-pills"))
+        nav = page.css_first('div[class*="cb-nav-pills"]')
         if nav:
-            for a in nav.find_all("a", href=True):
-                if "commentary" in a.get("href", "").lower() or (a.text and "commentary" in a.text.lower()):
-                    commentary_url = ("https://www.cricbuzz.com" + a["href"]) if a["href"].startswith("/") else a["href"]
+            for a in nav.css("a[href]"):
+                href = a.attributes.get("href") or ""
+                if "commentary" in href.lower() or "commentary" in a.text().lower():
+                    commentary_url = ("https://www.cricbuzz.com" + href) if href.startswith("/") else href
                     break
     except Exception:
         pass
@@ -623,35 +1130,26 @@ def get_live_commentary(match_url: str, limit: int = 20) -> dict:
     if not commentary_url:
         commentary_url = match_url.rstrip("/") + "/commentary"
 
-    cpage = _fetch(commentary_url)
+    cpage = await _fetch_page(commentary_url)
     if not cpage:
         return {"error": "Failed to load commentary page. This match may not have live commentary available."}
 
     result: dict = {"title": None, "commentary_url": commentary_url, "events": []}
-    title_tag = cpage.find("h1", class_=re.compile("cb-nav-hdr"))
+    title_tag = cpage.css_first('h1[class*="cb-nav-hdr"]')
     if title_tag:
-        result["title"] = title_tag.text.strip()
+        result["title"] = title_tag.text().strip()
 
+    # First selector in the cascade that matches anything wins
     candidates = []
-    candidates.extend(cpage.find_all("div", class_=re.compile(r"cb-col\s+cb-col-90\s+cb-com-ln")))
-    if not candidates:
-        lst = cpage.find("div", class_=re.compile("cb-com-lst"))
-        if lst:
-            candidates.extend(lst.find_all("div", class_=re.compile(r"cb-col\s+cb-col-90")))
-    if not candidates:
-        candidates.extend(cpage.find_all("p", class_=re.compile("cb-com-ln")))
-    if not candidates:
-        candidates.extend(cpage.find_all("div", class_=re.compile("cb-com-ln")))
-    if not candidates:
-        for div in cpage.find_all("div"):
-            text = div.get_text(" ", strip=True)
-            if text and len(text) > 20 and ("ball" in text.lower() or "over" in text.lower() or "wicket" in text.lower()):
-                candidates.append(div)
+    for selector in _COMMENTARY_SELECTORS:
+        candidates = cpage.css(selector)
+        if candidates:
+            break
 
     events = []
     for node in candidates:
         try:
-            text = node.get_text(" ", strip=True)
+            text = node.text(separator=" ", strip=True)
             if not text:
                 continue
             if text.lower().startswith("commentary"):
@@ -668,7 +1166,7 @@ def get_live_commentary(match_url: str, limit: int = 20) -> dict:
     if not events:
         result["note"] = "No commentary items found. This match may not be live or commentary may not be available."
         try:
-            match_info = get_match_details(match_url)
+            match_info = await get_match_details(match_url)
             if "error" not in match_info:
                 result["fallback"] = "Commentary not available, but here's the match details:"
                 result["match_details"] = match_info
@@ -678,8 +1176,8 @@ def get_live_commentary(match_url: str, limit: int = 20) -> dict:
     return result
 
 
-@mcp.tool()
-def web_search(query: str, num_results: int = 5, site_filter: str | None = None) -> list:
+@_tool()
+async def web_search(query: str, num_results: int = 5, site_filter: str | None = None) -> list:
     """
     General web search for cricket-related queries. Returns links with titles and snippets.
 
@@ -698,32 +1196,42 @@ def web_search(query: str, num_results: int = 5, site_filter: str | None = None)
     if site_filter:
         q = f"site:{site_filter} " + q
 
-    results = []
     try:
-        links = search(q, num_results=max(1, min(num_results, 10)))
+        links = await _google(q, max(1, min(num_results, 10)))
     except Exception as e:
         return [{"error": f"Search failed: {str(e)}"}]
 
-    for url in links:
-        item = {"url": url}
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=8)
-            resp.raise_for_status()
-            page = BeautifulSoup(resp.text, "lxml")
-            title = page.find("title")
-            desc = page.find("meta", attrs={"name": "description"})
-            item["title"] = title.text.strip() if title and title.text else url
-            item["snippet"] = desc["content"].strip() if desc and desc.get("content") else ""
-        except Exception:
-            item["title"] = url
-            item["snippet"] = ""
-        results.append(item)
+    # Fetch every result page at once; gather keeps them in search order
+    return list(await asyncio.gather(*(_page_meta(url) for url in links)))
 
-    return results
 
+async def _page_meta(url: str) -> dict:
+    """Return a search result's URL, title and snippet, falling back to the URL as title."""
+    meta = await _cached(_SEARCH_META_CACHE, url, lambda: _fetch_page_meta(url))
+    if "error" in meta:
+        return {"url": url, "title": url, "snippet": ""}
+    return meta
 
-@mcp.tool()
-def search_live_commentary(match_description: str = None, team1: str = None, team2: str = None) -> list:
+
+async def _fetch_page_meta(url: str) -> dict:
+    """Fetch a search result and pull out its title and meta description."""
+    try:
+        resp = await _client.get(url, timeout=8)
+        resp.raise_for_status()
+        page = LexborHTMLParser(resp.text)
+        title = page.css_first("title")
+        desc = page.css_first('meta[name="description"]')
+        return {
+            "url": url,
+            "title": title.text().strip() if title and title.text() else url,
+            "snippet": desc.attributes["content"].strip() if desc and desc.attributes.get("content") else "",
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@_tool(cache_hint="no-cache", ttl_seconds=10)
+async def search_live_commentary(match_description: str = None, team1: str = None, team2: str = None) -> list:
     """
     Search for live commentary and updates for cricket matches on the web.
     
@@ -744,26 +1252,109 @@ def search_live_commentary(match_description: str = None, team1: str = None, tea
     else:
         query = f"live commentary {team1} vs {team2} cricket"
     
-    # Search with cricket news sites
+    # Search Cricbuzz, ESPN Cricinfo and the general web at the same time
+    searches = await asyncio.gather(
+        web_search(query, num_results=3, site_filter="cricbuzz.com"),
+        web_search(query, num_results=3, site_filter="espncricinfo.com"),
+        web_search(query, num_results=5),
+    )
+
+    # Merge in source order, dropping pages more than one search returned
     results = []
-    
-    # Try Cricbuzz
-    cricbuzz_results = web_search(query, num_results=3, site_filter="cricbuzz.com")
-    if cricbuzz_results and "error" not in cricbuzz_results[0]:
-        results.extend(cricbuzz_results)
-    
-    # Try ESPN Cricinfo
-    espn_results = web_search(query, num_results=3, site_filter="espncricinfo.com")
-    if espn_results and "error" not in espn_results[0]:
-        results.extend(espn_results)
-    
-    # General search
-    general_results = web_search(query, num_results=5)
-    if general_results and "error" not in general_results[0]:
-        results.extend(general_results)
+    seen = set()
+    for found in searches:
+        if not found or "error" in found[0]:
+            continue
+        for item in found:
+            if item["url"] not in seen:
+                seen.add(item["url"])
+                results.append(item)
     
     return results[:10]  # Limit to 10 results
 
 
+@_tool()
+async def get_result_detail(id: str) -> dict:
+    """
+    Get the full payload behind a compact result id returned by another tool (e.g. get_cricket_news).
+
+    Args:
+        id (str): The "id" value from the earlier tool result, e.g. "news:1720794120".
+
+    Returns:
+        dict: {"id": str, "data": ...} with the stored result, or {"error": str} if it is unknown or expired.
+    """
+    data = _RESULT_STORE.get(id)
+    if data is None:
+        return {"error": f"No stored result for id '{id}'. It may have expired; call the original tool again."}
+    return {"id": id, "data": data}
+
+
+@_tool()
+async def get_cache_stats() -> dict:
+    """
+    Report hit/miss counters and the current state of the server's in-process caches,
+    plus how many HTTP responses arrived with each Content-Encoding.
+
+    Returns:
+        dict: {"hits": int, "misses": int, "caches": {name: {"size": int, "maxsize": int, "ttl": float}},
+               "encodings": {encoding: int}}
+    """
+    caches = {}
+    for name, cache in _CACHES.items():
+        cache.expire()
+        caches[name] = {"size": len(cache), "maxsize": cache.maxsize, "ttl": cache.ttl}
+    return {**_CACHE_STATS, "caches": caches, "encodings": dict(_ENCODING_STATS)}
+
+
+@_tool()
+async def batch_execute(calls: list[dict], max_concurrent: int = 4) -> list:
+    """
+    Run several cricket tools concurrently in a single request.
+
+    Args:
+        calls (list[dict]): Tool invocations, e.g.
+                            [{"tool": "get_player_stats", "args": {"player_name": "Virat Kohli"}},
+                             {"tool": "get_player_stats", "args": {"player_name": "Steve Smith"}}]
+        max_concurrent (int): Maximum number of tools running at the same time.
+
+    Returns:
+        list: One result per call, in the same order. Failed calls return {"error": str}.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    async def run(call: dict):
+        name = call.get("tool")
+        tool = _BATCH_TOOLS.get(name)
+        if tool is None:
+            return {"error": f"Unknown tool: {name}"}
+        async with semaphore:
+            try:
+                return await tool(**(call.get("args") or {}))
+            except Exception as e:
+                return {"error": f"{name} failed: {str(e)}"}
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+# Tools that batch_execute is allowed to dispatch to
+_BATCH_TOOLS = {
+    tool.__name__: tool
+    for tool in (
+        get_player_stats,
+        get_cricket_schedule,
+        get_match_details,
+        get_live_matches,
+        get_cricket_news,
+        get_icc_rankings,
+        get_live_commentary,
+        web_search,
+        search_live_commentary,
+        get_result_detail,
+        get_cache_stats,
+    )
+}
+
+
 if __name__ == "__main__":
     mcp.run(transport="stdio")
\ No newline at end of file